@@ -7,9 +7,12 @@ Fully Standalone – No external libraries required
 
 import os
 import sys
+import errno
 import hashlib
 import json
 import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -17,13 +20,77 @@ from zipfile import ZipFile
 #            INTERNAL UTILITIES
 # ============================================================
 
+# Extensions copied by catalogue_code
+CODE_EXTENSIONS = frozenset({".py", ".js", ".bat", ".ps1", ".json", ".md",
+                             ".html", ".ini", ".sql", ".xml", ".toml"})
+
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
+def fast_move(src, dst):
+    """Move a file with one rename; copy + unlink only across filesystems.
+
+    shutil.move stats, probes and falls back on its own; here only EXDEV
+    leads to a copy, and copy2 keeps it in the kernel (sendfile, or
+    copy_file_range on 3.14) with timestamps preserved.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        os.unlink(src)
+
+def reserve_path(path: Path, taken=None) -> Path:
+    """Claim path, or stem_N beside it, with an atomic O_EXCL create.
+
+    The caller replaces the empty placeholder. Unlike an exists() probe
+    this can't race another writer, and a free name costs one open.
+    taken is an optional set of normcased names known to be in the folder
+    (one listdir); those are skipped in memory rather than by a failed
+    open each. The O_EXCL create still decides, so a stale set is safe.
+    """
+    candidate, n = path, 1
+    while True:
+        key = os.path.normcase(candidate.name)
+        if taken is None or key not in taken:
+            try:
+                os.close(os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                return candidate
+            except FileExistsError:
+                pass
+            finally:
+                if taken is not None:
+                    taken.add(key)
+        candidate = path.with_name(f"{path.stem}_{n}{path.suffix}")
+        n += 1
+
+def walk_files(root):
+    """Yield a DirEntry for every file under root.
+
+    scandir reports the entry type from readdir, so unlike os.walk plus a
+    stat per file this costs no extra syscall to tell files from folders.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
 def hash_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+    # Unbuffered: file_digest (3.11+) reads into its own buffer in one C loop
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 18), b""):
             h.update(chunk)
     return h.hexdigest()
 
@@ -79,62 +146,133 @@ class HKOGrunt:
 
     def organise(self, sources):
         moves = []
+        made = {}  # EXT -> target folder str, created once per run
         for folder in sources:
             folder = Path(folder)
             if not folder.exists():
                 continue
 
-            for item in folder.iterdir():
-                if item.is_file():
-                    ext = item.suffix.lower().replace(".", "") or "misc"
+            # scandir: is_file() uses the readdir type, no stat per entry.
+            # Listed up front since we move into subfolders of this folder.
+            with os.scandir(folder) as it:
+                files = [entry for entry in it if entry.is_file()]
+
+            for entry in files:
+                ext = os.path.splitext(entry.name)[1].lower().replace(".", "") or "misc"
+                target = made.get(ext)
+                if target is None:
                     target = self.desktop / ext.upper()
                     ensure_dir(target)
-                    new_path = target / item.name
-                    try:
-                        shutil.move(str(item), str(new_path))
-                        moves.append((item, new_path))
-                    except Exception:
-                        pass
+                    target = made[ext] = str(target)
+                new_path = os.path.join(target, entry.name)
+                try:
+                    shutil.move(entry.path, new_path)
+                    moves.append((entry.path, new_path))
+                except Exception:
+                    pass
 
-        return {"moved": [(str(a), str(b)) for a, b in moves]}
+        return {"moved": moves}
 
     # ---------------------------------------------------------
     # Duplicate Finder
     # ---------------------------------------------------------
 
-    def find_duplicates(self, folders):
+    def iter_duplicates(self, folders):
+        """Yield (duplicate, original) path strings as they are found."""
+        # hash -> first path; plain str keeps this ~200 B/entry leaner than Path
         seen = {}
-        duplicates = []
+        # size -> first path of that size, not hashed until a second one
+        # turns up (None once it has been); unique sizes are never read
+        pending = {}
 
         for folder in folders:
-            folder = Path(folder)
-            if not folder.exists():
+            if not os.path.isdir(folder):
                 continue
 
-            for root, _, files in os.walk(folder):
-                for f in files:
-                    fp = Path(root) / f
-                    try:
-                        h = hash_file(fp)
-                        if h in seen:
-                            duplicates.append(fp)
-                        else:
-                            seen[h] = fp
-                    except:
-                        pass
+            for entry in walk_files(folder):
+                fp = entry.path
+                try:
+                    size = entry.stat().st_size
+                    first = pending.setdefault(size, fp)
+                    if first is fp:
+                        continue
+                    if first is not None:
+                        pending[size] = None
+                        try:
+                            seen.setdefault(hash_file(first), first)
+                        except OSError:
+                            pass
+                    h = hash_file(fp)
+                except:
+                    continue
+                original = seen.setdefault(h, fp)
+                if original is not fp:
+                    yield fp, original
 
-        return {"duplicates": [str(d) for d in duplicates]}
+    def find_duplicates(self, folders):
+        return {"duplicates": [d for d, _ in self.iter_duplicates(folders)]}
 
     def quarantine_duplicates(self, duplicates):
-        q = []
+        # One worker per source device (max 8): different disks move in
+        # parallel, while each disk is still worked through in order so
+        # an HDD doesn't seek between concurrent copies
+        groups = {}
+        errors = Counter()  # errno -> failed moves
         for d in duplicates:
             d = Path(d)
             try:
-                newp = self.quarantine / d.name
-                shutil.move(str(d), str(newp))
-                q.append((d, newp))
-            except:
-                pass
+                dev = os.stat(d).st_dev
+            except OSError as e:
+                errors[e.errno] += 1  # gone already; the move could only fail
+                continue
+            groups.setdefault(dev, []).append(d)
+
+        # Listed once, so a run of same-named duplicates finds its free
+        # stem_N in memory; shared by the workers, O_EXCL settles races
+        try:
+            taken = {os.path.normcase(n) for n in os.listdir(self.quarantine)}
+        except OSError:
+            taken = set()
+
+        def move_group(paths):
+            moved, failed = [], Counter()
+            for d in paths:
+                try:
+                    # Previously a same-named file in quarantine was silently overwritten
+                    newp = reserve_path(self.quarantine / d.name, taken)
+                    try:
+                        fast_move(d, newp)
+                    except OSError:
+                        os.unlink(newp)  # placeholder, or a partial cross-device copy
+                        raise
+                    moved.append((d, newp))
+                except OSError as e:
+                    failed[e.errno] += 1
+            return moved, failed
+
+        q = []
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(8, len(groups))) as pool:
+                for moved, failed in pool.map(move_group, groups.values()):
+                    q += moved
+                    errors += failed
+
+        # Make the batch's renames durable with one fsync of the quarantine
+        # folder rather than one per move (POSIX only; Windows has no dir fsync)
+        if q and hasattr(os, "O_DIRECTORY"):
+            try:
+                fd = os.open(self.quarantine, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass  # some filesystems refuse fsync on directories
+
+        # One line per run, not per file: a locked folder fails every file alike
+        if errors:
+            summary = ", ".join(f"{errno.errorcode.get(code, code)}: {n}" for code, n in errors.items())
+            print(f"[QUARANTINE] {sum(errors.values())} not moved - {summary}", file=sys.stderr)
         return q
 
     # ---------------------------------------------------------
@@ -144,26 +282,35 @@ class HKOGrunt:
     def catalogue_code(self, folders):
         ensure_dir(self.library)
 
-        extracted = []
-        allowed = {".py", ".js", ".bat", ".ps1", ".json", ".md",
-                   ".html", ".ini", ".sql", ".xml", ".toml"}
+        # Plain str paths: no Path object built per walked file
+        library = str(self.library)
+        # dst -> src; same-named files collapse so the last one found wins,
+        # as with the old serial copy, and no two workers share a target
+        jobs = {}
 
         for folder in folders:
             folder = Path(folder)
             if not folder.exists():
                 continue
 
-            for root, _, files in os.walk(folder):
-                for f in files:
-                    ext = Path(f).suffix.lower()
-                    if ext in allowed:
-                        src = Path(root) / f
-                        dst = self.library / f
-                        try:
-                            shutil.copy2(src, dst)
-                            extracted.append(str(dst))
-                        except:
-                            pass
+            for entry in walk_files(folder):
+                # rfind slice instead of splitext's tuple; i > 0 skips dotfiles
+                name = entry.name
+                i = name.rfind(".")
+                if i > 0 and name[i:].lower() in CODE_EXTENSIONS:
+                    jobs[os.path.join(library, name)] = entry.path
+
+        def copy_one(dst):
+            try:
+                shutil.copy2(jobs[dst], dst)
+                return dst
+            except:
+                return None
+
+        # Copies block in the kernel, so a few overlap seeks and writes;
+        # kept small to avoid thrashing a spinning disk
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            extracted = [dst for dst in pool.map(copy_one, jobs) if dst]
 
         return {"catalogue": extracted}
 
@@ -177,14 +324,15 @@ class HKOGrunt:
 
         zip_path = job_dir / f"{name}.zip"
 
+        # Entry paths all start with the walk root, so the archive name is
+        # a slice - no relpath or Path.relative_to per file
+        prefix = len(os.path.join(os.fspath(context_folder), ""))
         with ZipFile(zip_path, "w") as z:
-            for root, _, files in os.walk(context_folder):
-                for f in files:
-                    fp = Path(root) / f
-                    try:
-                        z.write(fp, arcname=str(fp.relative_to(context_folder)))
-                    except:
-                        pass
+            for entry in walk_files(context_folder):
+                try:
+                    z.write(entry.path, arcname=entry.path[prefix:])
+                except:
+                    pass
 
         (job_dir / "job.json").write_text(json.dumps({
             "name": name,
@@ -7,21 +7,36 @@ Changes: Desktop-safe paths, embedded UI, enriched logging, dry-run clarity
 
 import os
 import sys
+import errno
+import queue
+import atexit
+import threading
 import shutil
 import json
-import hashlib
+import time
+import functools
 import asyncio
-import sqlite3
 import uvicorn
-import zipfile
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Union
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from fastapi import FastAPI, BackgroundTasks, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import orjson  # noqa: F401 - ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
 
 # ... [CONFIGURATION CONSTANTS - Same as v5.0] ...
 APP_NAME = "HKO DAEMON"
@@ -30,15 +45,47 @@ DESKTOP_PATH = Path(os.path.expanduser("~/Desktop"))
 HKO_ROOT = DESKTOP_PATH / "HKO_METAVERSE"
 LOGS_ROOT = HKO_ROOT / "LOGS"
 SCHEMA_HASH = "init"  # Placeholder for schema versioning
+_DESKTOP_STR = str(DESKTOP_PATH)  # hot move paths use plain strings, not Path objects
+_HKO_ROOT_STR = str(HKO_ROOT)
+
+# OS metadata files that never count as loose desktop files. Casefolded:
+# Windows and macOS filesystems are case-insensitive ("Desktop.ini" is common)
+_SKIP_NAMES = frozenset(n.casefold() for n in ("desktop.ini", "Thumbs.db", ".DS_Store", ".localized"))
+
+# Repeat dry-runs of an unchanged file within this window reuse the previous verdict
+DRY_RUN_TTL_SECONDS = 5
+
+# Subfolder scans run in parallel on a shared pool so disk latency overlaps
+MAX_SCAN_DEPTH = 3
+_scan_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hko-scan")
+
+# Last desktop listing, reused while the desktop directory mtime is unchanged
+_scan_cache = {"mtime": 0, "data": []}
+
+# Directories confirmed to exist this session; later checks cost no syscall
+_known_dirs = set()
+
+# Log lines are queued and appended in batches by one writer thread, so a
+# burst of moves costs one file open instead of one per event
+LOG_BATCH_SECONDS = 0.05
+LOG_FLUSH_TIMEOUT = 2.0
+_log_queue = queue.SimpleQueue()
 
 # =============================================================================
 # SETUP HELPERS
 # =============================================================================
 
+def ensure_dir(path) -> None:
+    key = os.fspath(path)
+    if key not in _known_dirs:
+        os.makedirs(key, exist_ok=True)
+        _known_dirs.add(key)
+
+
 def ensure_environment() -> None:
     """Guarantee the desktop-safe directories exist for a truly standalone experience."""
-    HKO_ROOT.mkdir(parents=True, exist_ok=True)
-    LOGS_ROOT.mkdir(parents=True, exist_ok=True)
+    ensure_dir(HKO_ROOT)
+    ensure_dir(LOGS_ROOT)
     desktop_marker = HKO_ROOT / "README.txt"
     if not desktop_marker.exists():
         desktop_marker.write_text(
@@ -47,110 +94,271 @@ def ensure_environment() -> None:
         )
 
 
+def _write_log_lines(lines: List[str]) -> None:
+    ensure_dir(LOGS_ROOT)
+    logfile = LOGS_ROOT / "daemon.log"
+    try:
+        handle = logfile.open("a", encoding="utf-8")
+    except FileNotFoundError:
+        # LOGS was removed behind our back: forget it and recreate
+        _known_dirs.discard(os.fspath(LOGS_ROOT))
+        ensure_dir(LOGS_ROOT)
+        handle = logfile.open("a", encoding="utf-8")
+    with handle:
+        handle.writelines(lines)
+
+
+def _log_writer_loop() -> None:
+    """Drain _log_queue into the log file, one open/write/close per batch.
+
+    Besides lines the queue carries flush markers (threading.Event), set
+    once everything queued ahead of them has been written.
+    """
+    while True:
+        batch = [_log_queue.get()]
+        time.sleep(LOG_BATCH_SECONDS)  # let a burst of events pile up
+        try:
+            while True:
+                batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        lines = [item for item in batch if isinstance(item, str)]
+        try:
+            if lines:
+                _write_log_lines(lines)
+        except OSError as exc:
+            print(f"[{APP_NAME}] log write failed: {exc}", file=sys.stderr)
+        finally:
+            for item in batch:
+                if not isinstance(item, str):
+                    item.set()
+
+
+def flush_log() -> None:
+    """Wait for entries queued before this call; later ones don't extend the wait."""
+    done = threading.Event()
+    _log_queue.put(done)
+    done.wait(LOG_FLUSH_TIMEOUT)  # a stuck disk degrades to a slightly stale tail
+
+
 def log_event(message: str, level: str = "info") -> Dict[str, str]:
-    """Append a structured log entry and persist it to the desktop log file."""
+    """Queue a structured log entry for the background writer."""
     timestamp = datetime.now().isoformat()
     entry = {"time": timestamp, "msg": message, "type": level}
-    LOGS_ROOT.mkdir(parents=True, exist_ok=True)
-    logfile = LOGS_ROOT / "daemon.log"
-    with logfile.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry) + "\n")
+    _log_queue.put(json.dumps(entry) + "\n")
     return entry
 
 
-def read_recent_logs(limit: int = 30) -> List[Dict[str, str]]:
+def tail_log_lines(limit: int = 30) -> List[str]:
+    """Last `limit` raw JSON lines of the log, holding at most `limit` in memory."""
+    flush_log()  # read our own writes: wait for already queued entries to land
     logfile = LOGS_ROOT / "daemon.log"
     if not logfile.exists():
         return []
     with logfile.open("r", encoding="utf-8") as handle:
-        lines = handle.readlines()[-limit:]
-    return [json.loads(line) for line in lines if line.strip()]
+        return [line for line in deque(handle, maxlen=limit) if line.strip()]
+
+
+threading.Thread(target=_log_writer_loop, name="hko-log", daemon=True).start()
+atexit.register(flush_log)  # flush queued entries on shutdown
 
 # =============================================================================
 # UTILS
 # =============================================================================
 
+def unique_dest(target_dir: str, name: str, reserve: bool) -> str:
+    """First free `name`, `stem_1.ext`, `stem_2.ext`... in target_dir.
+
+    With reserve=True the slot is claimed atomically via O_CREAT|O_EXCL, so the
+    kernel detects collisions without a separate exists() probe.
+    """
+    stem, suffix = os.path.splitext(name)
+    counter = 0
+    while True:
+        candidate = os.path.join(target_dir, name if counter == 0 else f"{stem}_{counter}{suffix}")
+        if not reserve:
+            if not os.path.exists(candidate):
+                return candidate
+        else:
+            try:
+                os.close(os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                return candidate
+            except FileExistsError:
+                pass
+        counter += 1
+
+
+def fast_move(src: str, dest: str) -> None:
+    """Move with a single rename; copy + unlink only when crossing filesystems."""
+    try:
+        # replace, not rename: dest may be a placeholder reserved by unique_dest
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # shutil.copyfile uses sendfile/fcopyfile under the hood on 3.8+
+        shutil.copy2(src, dest)
+        os.unlink(src)
+
+
 def is_file_locked(filepath):
     """Checks if a file is locked by another process."""
-    if not os.path.exists(filepath): return False
     try:
-        # Try to rename it to itself (atomic check)
-        os.rename(filepath, filepath)
+        fd = os.open(filepath, os.O_RDONLY)
+    except FileNotFoundError:
         return False
     except OSError:
+        # Windows refuses the open outright when another app holds it exclusively
         return True
+    try:
+        # Non-blocking exclusive lock probe, released straight away
+        if os.name == "nt":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        return False
+    except OSError:
+        return True
+    finally:
+        os.close(fd)
 
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
 class MoveRequest(BaseModel):
-    src_path: str
-    dest_folder: str
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    src_path: str = Field(min_length=1)
+    dest_folder: str = Field(min_length=1)
     dry_run: bool = True
 
+
+@dataclass(slots=True, frozen=True)
+class MoveResult:
+    """Outcome of one move; immutable, so cached and shared instances are safe to return."""
+    success: bool
+    message: str
+    action: str
+    new_path: Optional[str] = None
+
+
+SOURCE_MISSING = MoveResult(False, "Source missing", "none")
+
 # =============================================================================
 # CORE LOGIC
 # =============================================================================
 
+@functools.lru_cache(maxsize=1024)
+def _dry_run_cached(src_path: str, dest_folder: str, mtime_ns: int, ttl_bucket: int) -> MoveResult:
+    """Dry-run verdict for one file; mtime_ns and ttl_bucket only key the cache."""
+    src_name = os.path.basename(src_path)
+    dest = unique_dest(os.path.join(_DESKTOP_STR, dest_folder), src_name, reserve=False)
+    if is_file_locked(src_path):
+        return MoveResult(False, f"[DRY-RUN] File is LOCKED by another app: {src_name}", "lock_error")
+
+    return MoveResult(True, f"[DRY-RUN] Verified & Ready: {src_name} -> {dest_folder}", "simulate", dest)
+
+
 class OrganizeEngine:
     def __init__(self):
         ensure_environment()
 
-    def scan_desktop(self):
-        candidates = []
-        for item in DESKTOP_PATH.iterdir():
-            if item.is_file() and item.name != "desktop.ini":
-                candidates.append(
-                    {
-                        "path": str(item),
-                        "name": item.name,
-                        "suggestion": "Unsorted",
-                        "size_kb": round(item.stat().st_size / 1024, 2),
-                    }
-                )
-        return candidates
+    @staticmethod
+    def _scan_dir(path: str, descend: bool):
+        """One scandir pass: (path, name, size) file tuples plus subfolders to visit."""
+        files, subdirs = [], []
+        # os.scandir reuses the readdir d_type, so is_file() needs no extra stat per entry
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.casefold() in _SKIP_NAMES:
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    files.append((entry.path, entry.name, entry.stat(follow_symlinks=False).st_size))
+                elif descend and entry.is_dir(follow_symlinks=False) and entry.path != _HKO_ROOT_STR:
+                    subdirs.append(entry.path)
+        return files, subdirs
+
+    def scan_desktop(self, depth: int = 0):
+        depth = max(0, min(depth, MAX_SCAN_DEPTH))
+        if depth == 0:
+            mtime = os.stat(DESKTOP_PATH).st_mtime_ns
+            if mtime != _scan_cache["mtime"]:
+                data, _ = self._scan_dir(DESKTOP_PATH, descend=False)
+                _scan_cache["mtime"], _scan_cache["data"] = mtime, data
+            data = _scan_cache["data"]
+        else:
+            data, pending = self._scan_dir(DESKTOP_PATH, descend=True)
+            level = 1
+            while pending:
+                futures = [_scan_executor.submit(self._scan_dir, p, level < depth) for p in pending]
+                pending = []
+                for future in as_completed(futures):
+                    try:
+                        files, subdirs = future.result()
+                    except OSError:
+                        continue  # unreadable subfolder
+                    data.extend(files)
+                    pending.extend(subdirs)
+                level += 1
+        return [
+            {"path": path, "name": name, "suggestion": "Unsorted", "size_kb": round(size / 1024, 2)}
+            for path, name, size in data
+        ]
 
-    def execute_move(self, src_path: str, dest_folder: str, dry_run: bool) -> Dict:
-        src = Path(src_path)
-        if not src.exists():
-            return {"success": False, "message": "Source missing", "action": "none"}
-        
-        target_dir = DESKTOP_PATH / dest_folder
-        dest = target_dir / src.name
-        
-        if dest.exists():
-            dest = target_dir / f"{src.stem}_{int(datetime.now().timestamp())}{src.suffix}"
+    def execute_batch(self, reqs: List[MoveRequest]) -> List[MoveResult]:
+        """Run many moves in inode order to cut seeks on rotating disks.
+
+        Results come back in request order. DirEntry.inode() comes from readdir
+        on POSIX, so ordering costs one scandir pass; files outside the top
+        level of the desktop keep their relative order at the end.
+        """
+        with os.scandir(DESKTOP_PATH) as it:
+            inode_map = {entry.path: entry.inode() for entry in it}
+        order = sorted(range(len(reqs)), key=lambda i: inode_map.get(reqs[i].src_path, sys.maxsize))
+        results = [None] * len(reqs)
+        for i in order:
+            req = reqs[i]
+            results[i] = self.execute_move(req.src_path, req.dest_folder, req.dry_run)
+        return results
+
+    def execute_move(self, src_path: str, dest_folder: str, dry_run: bool) -> MoveResult:
+        src_name = os.path.basename(src_path)
+        target_dir = os.path.join(_DESKTOP_STR, dest_folder)
             
         if dry_run:
-            # IMPROVED SIMULATION
-            if is_file_locked(src):
-                return {
-                    "success": False,
-                    "message": f"[DRY-RUN] File is LOCKED by another app: {src.name}",
-                    "action": "lock_error",
-                }
-                
-            return {
-                "success": True,
-                "message": f"[DRY-RUN] Verified & Ready: {src.name} -> {dest_folder}",
-                "action": "simulate",
-                "new_path": str(dest)
-            }
+            # IMPROVED SIMULATION - hover/confirm previews of the same file hit the cache
+            try:
+                mtime_ns = os.stat(src_path).st_mtime_ns
+            except FileNotFoundError:
+                return SOURCE_MISSING
+            ttl_bucket = int(time.monotonic() // DRY_RUN_TTL_SECONDS)
+            return _dry_run_cached(src_path, dest_folder, mtime_ns, ttl_bucket)
         else:
-            # EXECUTION
+            # EXECUTION - no pre-check stats: try the operation and handle the failure
             try:
-                target_dir.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(src), str(dest))
-                log_event(f"Moved {src.name} to {dest_folder}")
-                return {
-                    "success": True,
-                    "message": f"[LIVE] Moved {src.name} to {dest_folder}",
-                    "action": "move",
-                    "new_path": str(dest)
-                }
+                try:
+                    dest = unique_dest(target_dir, src_name, reserve=True)
+                except FileNotFoundError:
+                    os.makedirs(target_dir, exist_ok=True)
+                    dest = unique_dest(target_dir, src_name, reserve=True)
+                try:
+                    fast_move(src_path, dest)
+                except OSError:
+                    try:
+                        os.unlink(dest)
+                    except FileNotFoundError:
+                        pass
+                    raise
+                _dry_run_cached.cache_clear()
+                log_event(f"Moved {src_name} to {dest_folder}")
+                return MoveResult(True, f"[LIVE] Moved {src_name} to {dest_folder}", "move", dest)
+            except FileNotFoundError:
+                return SOURCE_MISSING
             except Exception as e:
-                return {"success": False, "message": str(e), "action": "error"}
+                return MoveResult(False, str(e), "error")
 
 
 # =============================================================================
@@ -327,7 +535,7 @@ HKO_UI_HTML_TEMPLATE = r"""
 
     async function refreshLogs() {
       const res = await fetch('/api/logs/recent');
-      const data = await res.json();
+      const data = (await res.text()).split('\n').filter(Boolean).map(line => JSON.parse(line));
       logFeed.innerHTML = '';
       data.reverse().forEach(pushLog);
     }
@@ -365,8 +573,41 @@ HKO_UI_HTML = (
 # API LAYER
 # =============================================================================
 
-app = FastAPI(title=f"{APP_NAME} {VERSION}")
-app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+class StaticCORSMiddleware:
+    """Wildcard CORS with pre-encoded headers; the policy never varies per request."""
+
+    HEADERS = [
+        (b"access-control-allow-origin", b"*"),
+        (b"access-control-allow-methods", b"*"),
+        (b"access-control-allow-headers", b"*"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            # Preflight: static answer, the app never sees it
+            await send({"type": "http.response.start", "status": 204, "headers": self.HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + self.HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app = FastAPI(title=f"{APP_NAME} {VERSION}", default_response_class=DefaultResponse)
+app.add_middleware(StaticCORSMiddleware)
 
 organizer = OrganizeEngine()
 log_event(f"{APP_NAME} {VERSION} booted and ready")
@@ -391,29 +632,50 @@ def status():
 
 
 @app.get("/api/organize/candidates")
-def get_organize_candidates():
-    return organizer.scan_desktop()
+async def get_organize_candidates(depth: int = 0):
+    return await asyncio.to_thread(organizer.scan_desktop, depth)
 
 
-@app.post("/api/organize/execute")
-def execute_organize_job(req: MoveRequest):
-    result = organizer.execute_move(req.src_path, req.dest_folder, req.dry_run)
-    if result.get("success"):
+def log_move_result(req: MoveRequest, result: MoveResult) -> None:
+    if result.success:
         tone = "info" if req.dry_run else "success"
-        log_event(result["message"], level=tone)
+        log_event(result.message, level=tone)
     else:
-        log_event(result.get("message", "Unknown error"), level="error")
+        log_event(result.message or "Unknown error", level="error")
+
+
+@app.post("/api/organize/execute")
+async def execute_organize_job(req: MoveRequest):
+    result = await asyncio.to_thread(organizer.execute_move, req.src_path, req.dest_folder, req.dry_run)
+    log_move_result(req, result)  # only queues the entry; no thread hop needed
     return result
 
 
+@app.post("/api/organize/execute_batch")
+async def execute_organize_batch(reqs: List[MoveRequest]):
+    results = await asyncio.to_thread(organizer.execute_batch, reqs)
+    for req, result in zip(reqs, results):
+        log_move_result(req, result)
+    return results
+
+
 @app.get("/api/logs/recent")
-def get_recent_logs(limit: int = 20):  # Increased limit
-    existing = read_recent_logs(limit)
-    if not existing:
-        return [log_event("System ready (v5.1 desktop standalone)")]
-    return existing
+async def get_recent_logs(limit: int = 20):  # Increased limit
+    return StreamingResponse(_log_stream(limit), media_type="application/x-ndjson")
+
+
+async def _log_stream(limit: int):
+    """ND-JSON tail: log lines are already JSON, so they are yielded without re-encoding."""
+    lines = await asyncio.to_thread(tail_log_lines, limit)
+    if not lines:
+        entry = log_event("System ready (v5.1 desktop standalone)")
+        lines = [json.dumps(entry) + "\n"]
+    for line in lines:
+        yield line.encode("utf-8") if line.endswith("\n") else (line + "\n").encode("utf-8")
 
 
 if __name__ == "__main__":
     print(f"🛡️ {APP_NAME} {VERSION} INITIALIZED (DESKTOP MODE)")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # "auto" picks uvloop/httptools when installed (uvloop has no Windows build);
+    # the UI polls constantly, so per-request access logging is skipped
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto", access_log=False)
\ No newline at end of file
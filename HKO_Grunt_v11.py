@@ -6,14 +6,37 @@
 
 import os
 import sys
+import errno
 import json
 import hashlib
+import mmap
 import shutil
+import sqlite3
 import threading
+import atexit
+import functools
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 from tkinter import *
 from tkinter import ttk, filedialog, messagebox
 
+try:
+    # Optional: SIMD + multi-threaded hashing, much faster than MD5 for dedup
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    # Optional: faster JSON encoder for config saves
+    import orjson
+except ImportError:
+    orjson = None
+
 # --------------------------------------------------------------
 # SAFE PATH HANDLING (works in EXE + Python)
 # --------------------------------------------------------------
@@ -43,80 +66,315 @@ ENV_FILE = HOME / "HKO_Env" / "HKO_Sleutels.env"
 # CONFIG LOADING
 # --------------------------------------------------------------
 
-DEFAULT_CONFIG = {
-    "quarantine": str(DESKTOP),
-    "scan_mode": "both"
-}
+@dataclass(slots=True)
+class Settings:
+    # Attribute access on a slots class: no dict lookups on hot paths
+    quarantine: str = str(DESKTOP)
+    scan_mode: str = "both"
+    hash_algorithm: str = "blake3"  # "md5" for compatibility with older hash lists
+
+
+_SETTINGS_FIELDS = frozenset(f.name for f in fields(Settings))
+
+# Last state written to / read from disk; saving an unchanged config is a no-op
+_saved_config = None
+
 
-if CONFIG_PATH.exists():
+def save_config(settings):
+    global _saved_config
+    config = asdict(settings)
+    if config == _saved_config:
+        return
+    # Write-then-rename: a crash mid-write can't leave a truncated config
+    tmp = CONFIG_PATH.with_suffix(".json.tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(config, f, indent=2)
+    os.replace(tmp, CONFIG_PATH)
+    _saved_config = config
+
+
+def load_config():
+    global _saved_config
     try:
-        CONFIG = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-    except:
-        CONFIG = DEFAULT_CONFIG
-else:
-    CONFIG = DEFAULT_CONFIG
-    CONFIG_PATH.write_text(json.dumps(CONFIG, indent=2), encoding="utf-8")
+        with CONFIG_PATH.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        settings = Settings()
+        save_config(settings)
+        return settings
+    except (OSError, json.JSONDecodeError):
+        return Settings()
+    # Missing keys take defaults; unknown keys are dropped
+    settings = Settings(**{k: v for k, v in data.items() if k in _SETTINGS_FIELDS})
+    _saved_config = asdict(settings)
+    return settings
+
+
+SETTINGS = load_config()
 
 
 # --------------------------------------------------------------
 # LOGGING UTIL
 # --------------------------------------------------------------
 
-def log(msg):
-    LOGS_PATH.mkdir(exist_ok=True)
-    logfile = LOGS_PATH / "grunt_log.txt"
-    logfile.write_text(
-        logfile.read_text() + msg + "\n" if logfile.exists() else msg + "\n",
-        encoding="utf-8"
-    )
-    print(msg)
+LOG_FILE = LOGS_PATH / "grunt_log.txt"
+
+# Workers only enqueue; a single listener thread owns the file handle
+_log_queue = queue.SimpleQueue()
+_log_handlers = [logging.FileHandler(LOG_FILE, encoding="utf-8")]
+if sys.stdout is not None:  # None in windowed EXE builds
+    _log_handlers.append(logging.StreamHandler(sys.stdout))
+for _h in _log_handlers:
+    _h.setFormatter(logging.Formatter("%(message)s"))
+
+logger = logging.getLogger("hko")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(QueueHandler(_log_queue))
+
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 
 # --------------------------------------------------------------
 # BACKGROUND THREAD DECORATOR (prevents UI freeze)
 # --------------------------------------------------------------
 
+# Persistent daemon workers, reused across clicks: a thread is only
+# started when every existing one is busy, so each action gets its own
+# worker as before without paying for a fresh thread each time
+_jobs = queue.SimpleQueue()
+_worker_lock = threading.Lock()
+_idle_workers = 0
+
+
+def _worker_loop():
+    global _idle_workers
+    while True:
+        fn, args, kwargs = _jobs.get()
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            logger.exception(f"[WORKER] {fn.__name__} failed")
+        with _worker_lock:
+            _idle_workers += 1
+
+
 def threaded(fn):
     def wrapper(*args, **kwargs):
-        t = threading.Thread(target=fn, args=args, kwargs=kwargs)
-        t.daemon = True
-        t.start()
+        global _idle_workers
+        with _worker_lock:
+            if _idle_workers:
+                _idle_workers -= 1  # an idle worker will pick this job up
+            else:
+                threading.Thread(target=_worker_loop, daemon=True).start()
+        _jobs.put((fn, args, kwargs))
     return wrapper
 
 
+# Rows per Listbox.insert call when filling result lists
+LIST_CHUNK = 500
+
+
+# --------------------------------------------------------------
+# FILE WALKING (os.scandir - no extra stat per entry)
+# --------------------------------------------------------------
+
+def walk_files(root, exclude=frozenset(), dir_mtimes=None):
+    """Yield a DirEntry for every file under root, depth-first.
+
+    DirEntry.is_dir/is_file reuse the type returned by readdir, so unlike
+    rglob + is_file + stat this costs no extra syscall per entry.
+    Folders whose normalized path is in exclude are never entered.
+    If dir_mtimes is a dict, each folder's st_mtime_ns is recorded in it.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            path = stack.pop()
+            if dir_mtimes is not None:
+                # Stat before listing: a change made mid-listing still shows
+                dir_mtimes[path] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if os.path.normcase(entry.path) not in exclude:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue  # unreadable folder
+
+
 # --------------------------------------------------------------
-# DUPLICATE LOGIC (MD5 HASHING)
+# DUPLICATE LOGIC (BLAKE3 HASHING, MD5 FALLBACK)
 # --------------------------------------------------------------
 
-def file_hash(path):
-    h = hashlib.md5()
+HASH_CHUNK_BYTES = 1 << 20  # 1 MiB: ~256x fewer read() calls than 4 KiB
+# Files in this range are mmapped: smaller ones don't repay the mapping,
+# larger ones could exhaust a 32-bit EXE's address space
+MMAP_MIN_BYTES = 1 << 20
+MMAP_MAX_BYTES = 1 << 30
+
+# Dedup only, not security: skips the FIPS gate. Never updated, so
+# copy() from any thread is safe and cheaper than a fresh EVP context.
+_MD5_BASE = hashlib.new("md5", usedforsecurity=False)
+
+
+def effective_hash_algorithm():
+    """The algorithm file_hash will really use: blake3 only when installed."""
+    return "blake3" if blake3 is not None and SETTINGS.hash_algorithm == "blake3" else "md5"
+
+
+def file_hash(path, algorithm):
+    if algorithm == "blake3":
+        h = blake3(max_threads=blake3.AUTO)
+        try:
+            h.update_mmap(path)
+        except:
+            return None
+        return h.hexdigest()
+
+    h = _MD5_BASE.copy()
     try:
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                h.update(chunk)
+            size = os.fstat(f.fileno()).st_size
+            if MMAP_MIN_BYTES <= size <= MMAP_MAX_BYTES:
+                # Hash straight from the page cache, no copy into bytes chunks
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+            else:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                    h.update(chunk)
     except:
         return None
     return h.hexdigest()
 
 
-def find_duplicates(root_paths):
-    seen = {}
-    duplicates = []
+PARTIAL_HASH_BYTES = 64 * 1024
 
-    for root in root_paths:
-        root = Path(root)
-        if not root.exists():
-            continue
 
-        for file in root.rglob("*.*"):
-            if file.is_file():
-                h = file_hash(file)
-                if h:
-                    if h in seen:
-                        duplicates.append((file, seen[h]))
-                    else:
-                        seen[h] = file
+def partial_hash(path):
+    """Hash of the first PARTIAL_HASH_BYTES only; cheap pre-filter before a full hash."""
+    try:
+        with open(path, "rb") as f:
+            h = _MD5_BASE.copy()
+            h.update(f.read(PARTIAL_HASH_BYTES))
+            return h.hexdigest()
+    except:
+        return None
+
+
+def _hash_groups(entries, hashes):
+    """Split (size, path, mtime) entries into groups sharing size and hash; singletons dropped."""
+    groups = {}
+    for entry, h in zip(entries, hashes):
+        if h:
+            groups.setdefault((entry[0], h), []).append(entry)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+HASH_CACHE_PATH = LIBRARY / "hash_cache.sqlite"
+
 
+def cached_file_hashes(pool, paths, algorithm):
+    """file_hash for each path, reusing hashes stored by earlier scans.
+
+    Keyed by (st_dev, st_ino), so a file keeps its entry when organising
+    moves it within a drive; a changed mtime, size or algorithm forces a
+    rehash. The connection stays on the calling thread, the pool only
+    hashes. A broken cache file just means hashing everything.
+    """
+    hash_fn = functools.partial(file_hash, algorithm=algorithm)
+    hashes = [None] * len(paths)
+    stats = [None] * len(paths)
+    try:
+        db = sqlite3.connect(HASH_CACHE_PATH)
+    except sqlite3.Error:
+        return list(pool.map(hash_fn, paths))
+    try:
+        db.execute("CREATE TABLE IF NOT EXISTS files (dev INTEGER, ino INTEGER, mtime INTEGER, "
+                   "size INTEGER, algorithm TEXT, hash TEXT, PRIMARY KEY (dev, ino))")
+        for i, path in enumerate(paths):
+            try:
+                # Full stat: on Windows scandir leaves st_dev/st_ino at 0
+                st = stats[i] = os.stat(path)
+            except OSError:
+                continue
+            row = db.execute("SELECT hash FROM files WHERE dev = ? AND ino = ? AND mtime = ? "
+                             "AND size = ? AND algorithm = ?",
+                             (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, algorithm)).fetchone()
+            if row:
+                hashes[i] = row[0]
+
+        todo = [i for i, st in enumerate(stats) if st is not None and hashes[i] is None]
+        fresh = []
+        for i, h in zip(todo, pool.map(hash_fn, [paths[i] for i in todo])):
+            hashes[i] = h
+            if h:
+                st = stats[i]
+                fresh.append((st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, algorithm, h))
+        with db:  # one transaction for the whole batch
+            db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", fresh)
+    except sqlite3.Error as e:
+        logger.warning(f"[DUPLICATES] Hash cache unavailable: {e}")
+        missing = [i for i, h in enumerate(hashes) if h is None]
+        for i, h in zip(missing, pool.map(hash_fn, [paths[i] for i in missing])):
+            hashes[i] = h
+    finally:
+        db.close()
+    return hashes
+
+
+def dup_scan_excludes(root_paths):
+    """Our own output folders: LOGS grows as we scan and Code_Repository is
+    duplicates by design. The quarantine is skipped too, unless it is one of
+    the roots (it defaults to the Desktop itself)."""
+    excludes = {METAVERSE, Path(SETTINGS.quarantine)} - {Path(r) for r in root_paths}
+    return frozenset(os.path.normcase(os.path.normpath(p)) for p in excludes)
+
+
+def find_duplicates(root_paths):
+    # Settings are read once per scan: a save mid-scan can't mix algorithms,
+    # and the per-file path does no SETTINGS lookup
+    algorithm = effective_hash_algorithm()
+    exclude = dup_scan_excludes(root_paths)
+
+    # Pass 1: bucket by size - files of different size can never be duplicates.
+    # One stat per file; size and mtime travel with the path from here on.
+    size_map = {}
+    for root in root_paths:
+        for entry in walk_files(root, exclude):
+            if "." not in entry.name:
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            size_map.setdefault(st.st_size, []).append((st.st_size, entry.path, st.st_mtime))
+
+    candidates = [entry for entries in size_map.values() if len(entries) > 1 for entry in entries]
+
+    # hashlib/blake3 and file reads release the GIL, so threads keep the disk queue full
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        # Pass 2: hash only the head; for small files the head is the whole file
+        head_groups = _hash_groups(candidates, pool.map(partial_hash, [e[1] for e in candidates]))
+        groups = [g for g in head_groups if g[0][0] <= PARTIAL_HASH_BYTES]
+
+        # Pass 3: full hash only where heads of larger files collide;
+        # unchanged files reuse the hash from the previous scan
+        large = [entry for g in head_groups if g[0][0] > PARTIAL_HASH_BYTES for entry in g]
+        groups += _hash_groups(large, cached_file_hashes(pool, [e[1] for e in large], algorithm))
+
+    duplicates = []
+    for group in groups:
+        # Oldest copy is the original; mtime comes from the walk, not a fresh stat
+        original = min(group, key=lambda entry: entry[2])
+        duplicates.extend((entry[1], original[1]) for entry in group if entry is not original)
     return duplicates
 
 
@@ -124,18 +382,190 @@ def find_duplicates(root_paths):
 # CODE EXTRACTION LOGIC
 # --------------------------------------------------------------
 
-CODE_EXT = [".py", ".html", ".js", ".json", ".txt", ".css", ".md"]
+CODE_EXT = frozenset({".py", ".html", ".js", ".json", ".txt", ".css", ".md"})
+
+
+# Errors meaning "the kernel can't do this copy here", not "the copy failed"
+_KERNEL_COPY_REFUSED = (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP)
+
+# Userspace fallback buffer; 1 MiB keeps NAS/network shares saturated
+COPY_BUFSIZE = 1 << 20
+
+# Max bytes per sendfile call (Linux caps a single call near 2 GiB)
+SENDFILE_CHUNK = 1 << 30
+
+
+def fast_copy(src, dst):
+    """shutil.copy, but in-kernel where the platform allows.
+
+    Tries copy_file_range (can reflink on btrfs/XFS), then sendfile on
+    Linux, then a userspace copy with a COPY_BUFSIZE buffer.
+    Raises shutil.SameFileError, as shutil.copy does, if dst is src.
+    """
+    with open(src, "rb") as fsrc:
+        st = os.fstat(fsrc.fileno())
+        # Must come before opening dst with "wb": truncating dst would empty src
+        try:
+            same = os.path.samestat(st, os.stat(dst))
+        except FileNotFoundError:
+            same = False
+        if same:
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+        with open(dst, "wb") as fdst:
+            infd, outfd = fsrc.fileno(), fdst.fileno()
+            size = st.st_size
+            copied = 0
+
+            if size and hasattr(os, "copy_file_range"):
+                try:
+                    while copied < size:
+                        n = os.copy_file_range(infd, outfd, size - copied)
+                        if n == 0:
+                            break
+                        copied += n
+                except OSError as e:
+                    if copied or e.errno not in _KERNEL_COPY_REFUSED:
+                        raise
+
+            if size and not copied and sys.platform.startswith("linux"):
+                try:
+                    while copied < size:
+                        n = os.sendfile(outfd, infd, copied, min(size - copied, SENDFILE_CHUNK))
+                        if n == 0:
+                            break
+                        copied += n
+                except OSError as e:
+                    if copied or e.errno not in _KERNEL_COPY_REFUSED:
+                        raise
+
+            # Nothing copied in-kernel (or size unknown, e.g. 0 for special files)
+            if not copied:
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+    shutil.copymode(src, dst)
+
+
+# name -> [source path, ino, mtime_ns, size, target mtime_ns] of the last
+# copy into CODE_REPO; persisted so a later run can tell what is current
+CODE_SOURCES_PATH = LIBRARY / "code_sources.json"
+
+
+def load_code_sources():
+    try:
+        with CODE_SOURCES_PATH.open(encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}  # no record just means copying everything once
+
+
+def save_code_sources(sources):
+    tmp = CODE_SOURCES_PATH.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(sources, f)
+    os.replace(tmp, CODE_SOURCES_PATH)
+
+
+def _copy_one(job, sources):
+    """Copy one file into CODE_REPO; return (name, record) or None on failure.
+
+    Skipped only when the target came from this very source (same path and
+    inode, unchanged mtime_ns and size) and nobody touched the target since.
+    Comparing against the target alone can't tell two same-sized utils.py
+    from different folders apart.
+    """
+    name, src, st = job
+    target = CODE_REPO / name
+    # scandir leaves st_ino at 0 on Windows; path + mtime_ns + size still identify
+    source = [src, st.st_ino if os.name != "nt" else 0, st.st_mtime_ns, st.st_size]
+    last = sources.get(name)
+    if last and last[:4] == source:
+        try:
+            if target.stat().st_mtime_ns == last[4]:
+                return name, last
+        except OSError:
+            pass
+    try:
+        fast_copy(src, target)
+        return name, source + [target.stat().st_mtime_ns]
+    except OSError as e:
+        logger.info(f"[CODE] Copy failed: {src} ({e})")
+        return None
+
+
+# Our own tree is never walked for code: Code_Repository would feed its
+# copies back in as sources, and config, log and record files would be
+# catalogued. CODE_REPO is listed too in case HKO_METAVERSE is the folder
+CODE_WALK_EXCLUDE = frozenset(os.path.normcase(os.path.normpath(p)) for p in (METAVERSE, CODE_REPO))
+
+# normcased folder -> ({dir: mtime_ns}, [(name, path)]) from its last code walk
+_code_walk_cache = {}
+
+
+def _dirs_unchanged(dir_mtimes):
+    """A folder's mtime moves whenever an entry in it is added, removed or
+    renamed, so if none moved the set of files under them is the same."""
+    try:
+        return all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def _code_entries(folder):
+    """(name, path, DirEntry or None) for each code file under folder.
+
+    A repeat extraction of an unchanged tree reuses the previous walk's
+    file list (entry None) instead of listing every folder again.
+    """
+    key = os.path.normcase(os.path.abspath(folder))
+    cached = _code_walk_cache.get(key)
+    if cached and _dirs_unchanged(cached[0]):
+        return [(name, path, None) for name, path in cached[1]]
+
+    dir_mtimes, found = {}, []
+    for entry in walk_files(folder, CODE_WALK_EXCLUDE, dir_mtimes):
+        # rfind slice instead of splitext's tuple; i > 0 skips dotfiles, as splitext does
+        name = entry.name
+        i = name.rfind(".")
+        if i > 0 and name[i:].lower() in CODE_EXT:
+            found.append((name, entry.path, entry))
+    _code_walk_cache[key] = (dir_mtimes, [(name, path) for name, path, _ in found])
+    return found
 
 
 def extract_code_from_folder(folder):
-    folder = Path(folder)
-    extracted = []
-    for file in folder.rglob("*"):
-        if file.suffix.lower() in CODE_EXT:
-            target = CODE_REPO / file.name
-            shutil.copy(file, target)
-            extracted.append(file.name)
-    return extracted
+    # CODE_REPO is flat: the last file seen under a name wins, as it did
+    # when copying sequentially; collapsing first keeps two workers from
+    # writing the same target at once.
+    jobs = {}
+    for name, path, entry in _code_entries(folder):
+        try:
+            # Always a fresh stat: edits don't touch folder mtimes, and
+            # _copy_one compares it with the recorded source to skip copies
+            jobs[name] = (path, entry.stat() if entry else os.stat(path))
+        except OSError:
+            continue
+
+    work = [(n, p, st) for n, (p, st) in jobs.items()]
+    if os.name != "nt":
+        # Inode order roughly follows on-disk layout on ext4/XFS, so an HDD
+        # or backup drive reads forward instead of seeking back and forth
+        work.sort(key=lambda job: job[2].st_ino)
+
+    # Copies block in the kernel with the GIL released, so threads scale
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    sources = load_code_sources()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = [r for r in pool.map(_copy_one, work, repeat(sources)) if r]
+    # Workers only read sources; the records are merged here, on one thread
+    copied = dict(results)
+    if any(sources.get(name) != record for name, record in results):
+        sources.update(copied)
+        try:
+            save_code_sources(sources)
+        except OSError as e:
+            logger.warning(f"[CODE] Could not save copy records: {e}")
+    # Report in walk order, not the inode order the copies ran in
+    return [name for name in jobs if name in copied]
 
 
 # --------------------------------------------------------------
@@ -150,6 +580,12 @@ class GruntApp(Tk):
 
         self.build_ui()
 
+    # ----------------------------------------------------------
+    # UI-THREAD HELPERS (Tk is not thread-safe; workers go via after)
+    # ----------------------------------------------------------
+    def ui(self, fn, *args):
+        self.after(0, fn, *args)
+
     # ----------------------------------------------------------
     def build_ui(self):
         self.tabs = ttk.Notebook(self)
@@ -170,7 +606,15 @@ class GruntApp(Tk):
         self.build_org_tab()
         self.build_dup_tab()
         self.build_code_tab()
-        self.build_settings_tab()
+
+        # Rarely opened tabs are built the first time they are selected
+        self._lazy_tabs = {str(self.tab_settings): self.build_settings_tab}
+        self.tabs.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+    def on_tab_changed(self, event):
+        build = self._lazy_tabs.pop(self.tabs.select(), None)
+        if build is not None:
+            build()
 
     # ----------------------------------------------------------
     # ORGANIZE TAB
@@ -184,7 +628,7 @@ class GruntApp(Tk):
         self.org_list = Listbox(self.tab_org, height=10)
         self.org_list.pack(fill="x", pady=5)
 
-        self.run_org_btn = Button(self.tab_org, text="Run organization", command=self.run_organize_threaded)
+        self.run_org_btn = Button(self.tab_org, text="Run organization", command=self.run_organize)
         self.run_org_btn.pack(anchor="w", pady=5)
 
     def select_org_folders(self):
@@ -192,18 +636,20 @@ class GruntApp(Tk):
         if folder:
             self.org_list.insert(END, folder)
 
-    @threaded
-    def run_organize_threaded(self):
+    def run_organize(self):
         folders = list(self.org_list.get(0, END))
         if not folders:
             messagebox.showerror("Error", "No folders selected.")
             return
+        self.run_organize_threaded(folders)
 
+    @threaded
+    def run_organize_threaded(self, folders):
         # Very lightweight placeholder classification
         for f in folders:
-            log(f"[ORGANIZE] Scanned: {f}")
+            logger.info(f"[ORGANIZE] Scanned: {f}")
 
-        messagebox.showinfo("Done", "Organization complete.")
+        self.ui(messagebox.showinfo, "Done", "Organization complete.")
 
     # ----------------------------------------------------------
     # DUPLICATES TAB
@@ -215,22 +661,51 @@ class GruntApp(Tk):
         self.scan_dup_btn = Button(self.tab_dup, text="Scan for duplicates", command=self.run_dup_scan)
         self.scan_dup_btn.pack(anchor="w", pady=5)
 
-        self.dup_list = Listbox(self.tab_dup)
+        # Selection lives in Tk's own Listbox state: clicks never rewrite rows
+        self.dup_list = Listbox(self.tab_dup, selectmode=EXTENDED)
         self.dup_list.pack(fill="both", expand=True)
 
+        dup_actions = Frame(self.tab_dup)
+        dup_actions.pack(anchor="w", pady=5)
+        Button(dup_actions, text="Select all", command=lambda: self.dup_list.selection_set(0, END)).pack(side="left")
+        Button(dup_actions, text="Select none", command=lambda: self.dup_list.selection_clear(0, END)).pack(side="left")
+
+        # (duplicate, original) per dup_list row, so actions never parse row text
+        self.dup_pairs = []
+
     @threaded
     def run_dup_scan(self):
         roots = [
             DESKTOP,
             HOME / "Downloads"
         ]
-        log("[DUPLICATES] Scanning...")
+        logger.info("[DUPLICATES] Scanning...")
         dups = find_duplicates(roots)
-        self.dup_list.delete(0, END)
-
-        for f1, f2 in dups:
-            self.dup_list.insert(END, f"{f1}  ==  {f2}")
-
+        self.ui(self.show_dup_results, dups)
+
+    def show_dup_results(self, dups):
+        # Apply only the delta: rows still present keep their place (and
+        # selection); vanished runs go in one delete each, new rows are appended
+        fresh = set(dups)
+        kept = [pair in fresh for pair in self.dup_pairs]
+        end = len(kept)
+        while end:
+            if kept[end - 1]:
+                end -= 1
+                continue
+            start = end - 1
+            while start and not kept[start - 1]:
+                start -= 1
+            self.dup_list.delete(start, end - 1)
+            del self.dup_pairs[start:end]
+            end = start
+
+        known = set(self.dup_pairs)
+        added = [pair for pair in dups if pair not in known]
+        rows = [f"{f1}  ==  {f2}" for f1, f2 in added]
+        for i in range(0, len(rows), LIST_CHUNK):
+            self.dup_list.insert(END, *rows[i:i + LIST_CHUNK])
+        self.dup_pairs.extend(added)
         messagebox.showinfo("Done", "Duplicate scan complete.")
 
     # ----------------------------------------------------------
@@ -240,42 +715,105 @@ class GruntApp(Tk):
         self.code_btn = Button(self.tab_code, text="Extract Code", command=self.run_code_extract)
         self.code_btn.pack(anchor="w", pady=5)
 
-        self.code_list = Listbox(self.tab_code)
-        self.code_list.pack(fill="both", expand=True)
+        # Virtual list: every extracted name stays in _code_items, but the
+        # Treeview only ever holds the rows that fit on screen
+        frame = Frame(self.tab_code)
+        frame.pack(fill="both", expand=True)
+        self.code_scroll = Scrollbar(frame, orient="vertical", command=self.scroll_code)
+        self.code_scroll.pack(side="right", fill="y")
+        self.code_list = ttk.Treeview(frame, columns=("path",), show="headings")
+        self.code_list.heading("path", text="Extracted file", anchor="w")
+        self.code_list.pack(side="left", fill="both", expand=True)
+
+        self._code_items = []
+        self._code_first = 0
+        self._code_rows = 1
+        self.code_list.bind("<Configure>", self.on_code_resize)
+        self.code_list.bind("<MouseWheel>", lambda e: self.scroll_code("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.code_list.bind("<Button-4>", lambda e: self.scroll_code("scroll", -1, "units"))
+        self.code_list.bind("<Button-5>", lambda e: self.scroll_code("scroll", 1, "units"))
 
-    @threaded
     def run_code_extract(self):
         folder = filedialog.askdirectory()
-        if not folder:
-            return
+        if folder:
+            self.run_code_extract_threaded(folder)
+
+    @threaded
+    def run_code_extract_threaded(self, folder):
         extracted = extract_code_from_folder(folder)
-        self.code_list.delete(0, END)
-        for e in extracted:
-            self.code_list.insert(END, e)
+        self.ui(self.show_code_results, extracted)
+
+    def show_code_results(self, extracted):
+        self._code_items = extracted
+        self._code_first = 0
+        self.render_code_list()
         messagebox.showinfo("Done", "Code extracted.")
 
+    def on_code_resize(self, event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        rows = max(1, event.height // row_height - 1)  # one row's worth for the heading
+        if rows != self._code_rows:
+            self._code_rows = rows
+            self.render_code_list()
+
+    def scroll_code(self, action, amount, unit=None):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if action == "moveto":
+            first = int(float(amount) * len(self._code_items))
+        else:
+            step = self._code_rows if unit == "pages" else 1
+            first = self._code_first + int(amount) * step
+        self._code_first = first
+        self.render_code_list()
+
+    def render_code_list(self):
+        items, rows = self._code_items, self._code_rows
+        first = self._code_first = max(0, min(self._code_first, len(items) - rows))
+        window = items[first:first + rows]
+
+        view = self.code_list
+        view.delete(*view.get_children())
+        for name in window:
+            view.insert("", END, values=(name,))
+        if items:
+            self.code_scroll.set(first / len(items), (first + len(window)) / len(items))
+        else:
+            self.code_scroll.set(0, 1)
+
     # ----------------------------------------------------------
     # SETTINGS TAB
     # ----------------------------------------------------------
     def build_settings_tab(self):
         Label(self.tab_settings, text="Quarantine Folder:", font=("Arial", 11, "bold")).pack(anchor="w")
-        self.q_var = StringVar(value=CONFIG["quarantine"])
+        self.q_var = StringVar(value=SETTINGS.quarantine)
 
         self.q_entry = Entry(self.tab_settings, textvariable=self.q_var, width=60)
         self.q_entry.pack(anchor="w")
 
         Button(self.tab_settings, text="Browse", command=self.pick_quarantine).pack(anchor="w")
 
+        Label(self.tab_settings, text="Duplicate hash:", font=("Arial", 11, "bold")).pack(anchor="w", pady=(10, 0))
+        self.hash_var = StringVar(value=SETTINGS.hash_algorithm)
+        ttk.Combobox(self.tab_settings, textvariable=self.hash_var, values=("blake3", "md5"),
+                     state="readonly", width=10).pack(anchor="w")
+
         Button(self.tab_settings, text="Save", command=self.save_settings).pack(anchor="w", pady=5)
 
+        # Settings field -> bound Var.get, resolved once instead of per save
+        self._setting_getters = (
+            ("quarantine", self.q_var.get),
+            ("hash_algorithm", self.hash_var.get),
+        )
+
     def pick_quarantine(self):
         folder = filedialog.askdirectory()
         if folder:
             self.q_var.set(folder)
 
     def save_settings(self):
-        CONFIG["quarantine"] = self.q_var.get()
-        CONFIG_PATH.write_text(json.dumps(CONFIG, indent=2), encoding="utf-8")
+        for key, get in self._setting_getters:
+            setattr(SETTINGS, key, get())
+        save_config(SETTINGS)
         messagebox.showinfo("Saved", "Settings saved.")
 
 
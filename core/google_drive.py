@@ -35,4 +35,6 @@ class DriveFetcher:
         while done is False:
             status, done = downloader.next_chunk()
         print(f"... Download complete.")
-        return fh.getvalue().decode('utf-8')
\ No newline at end of file
+        # Decode straight from the buffer; getvalue() would copy it to bytes first
+        with fh.getbuffer() as buf:
+            return str(buf, 'utf-8')
\ No newline at end of file
@@ -2,6 +2,8 @@ import sys
 import os
 import yaml
 import json
+import html
+import functools
 from datetime import datetime
 from core.google_drive import DriveFetcher
 from core.processor import DocumentProcessor
@@ -13,6 +15,17 @@ with open('config.yaml', 'r') as f:
 OUTPUT_DIR = CONFIG['output_directory']
 MANIFEST_FILE = CONFIG['manifest_file']
 DRIVE_FOLDER_ID = CONFIG['source_drive_folder_id']
+HTML_CHUNK = 1 << 16  # characters escaped and written per step
+
+# --- Shared clients: built on first use, reused for the whole batch ---
+@functools.cache
+def get_drive():
+    # Credential load + API discovery happen once, not per Drive input
+    return DriveFetcher(DRIVE_FOLDER_ID)
+
+@functools.cache
+def get_processor():
+    return DocumentProcessor()
 
 # --- 1. Validation Logic ---
 def validate_document(text):
@@ -24,7 +37,7 @@ def validate_document(text):
     return True
 
 # --- 2. Orchestration ---
-def run_workflow(file_input):
+def run_workflow(file_input, manifest=None):
     try:
         print(f"---== STARTING WORKFLOW FOR INPUT: {file_input} ==---")
 
@@ -40,16 +53,17 @@ def run_workflow(file_input):
             print(f"... Fetched local file: {file_name_raw}")
         else:
             # 1B. Fetch from Google Drive
-            drive = DriveFetcher(DRIVE_FOLDER_ID)
+            drive = get_drive()
             file_id = file_input
             file_metadata = drive.service.files().get(fileId=file_id, fields='name').execute()
             file_name_raw = file_metadata['name']
             raw_text = drive.download_file(file_id, file_name_raw)
 
         # 2. Process
-        processor = DocumentProcessor()
+        processor = get_processor()
         processing_prompt = "You are an expert editor. Review the following document, fix any errors, and format it clearly."
         processed_text = processor.process(raw_text, processing_prompt)
+        del raw_text  # only the processed copy is needed from here on
 
         # 3. Validate
         if not validate_document(processed_text):
@@ -66,37 +80,52 @@ def run_workflow(file_input):
         output_path = os.path.join(OUTPUT_DIR, output_filename)
         # --- End of Update ---
 
-        html_content = f"<html><head><title>{file_name_base}</title></head><body>"
-        html_content += f"<h1>{file_name_base}</h1>"
-        html_content += f"<pre>{processed_text}</pre>"
-        html_content += "</body></html>"
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Written piece by piece: no full-document HTML string, and the text is
+        # escaped so "<", ">" and "&" in it can't break the markup
+        title = html.escape(file_name_base)
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(f"<html><head><title>{title}</title></head><body>")
+            f.write(f"<h1>{title}</h1>")
+            f.write("<pre>")
+            # escape() maps single characters, so 64 KB slices escape independently
+            for i in range(0, len(processed_text), HTML_CHUNK):
+                f.write(html.escape(processed_text[i:i + HTML_CHUNK], quote=False))
+            f.write("</pre>")
+            f.write("</body></html>")
         print(f"... Successfully saved to {output_path}")
 
-        # 5. Update Manifest
-        update_manifest(file_name_raw, output_filename)
+        # 5. Update Manifest (batch callers pass the list and save once)
+        if manifest is None:
+            update_manifest(file_name_raw, output_filename)
+        else:
+            append_manifest_entry(manifest, file_name_raw, output_filename)
         print(f"---== WORKFLOW COMPLETE FOR: {file_name_raw} ==---")
 
     except Exception as e:
         print(f"[!!] WORKFLOW FAILED for {file_input}: {e}")
 
-def update_manifest(file_name, output_filename):
-    manifest = []
+def load_manifest():
     if os.path.exists(MANIFEST_FILE):
         with open(MANIFEST_FILE, 'r') as f:
-            manifest = json.load(f)
+            return json.load(f)
+    return []
+
+def save_manifest(manifest):
+    with open(MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2)
 
-    entry = {
+def append_manifest_entry(manifest, file_name, output_filename):
+    manifest.append({
         'source_name': file_name,
         'output_file': output_filename,
         'processed_date': datetime.now().isoformat()
-    }
-    manifest.append(entry)
+    })
+    print("... Manifest entry added.")
 
-    with open(MANIFEST_FILE, 'w') as f:
-        json.dump(manifest, f, indent=2)
+def update_manifest(file_name, output_filename):
+    manifest = load_manifest()
+    append_manifest_entry(manifest, file_name, output_filename)
+    save_manifest(manifest)
     print("... Manifest updated.")
 
 # --- Main Entry Point ---
@@ -107,6 +136,14 @@ if __name__ == "__main__":
 
     file_inputs = sys.argv[1:]
     print(f"Starting batch process for {len(file_inputs)} file(s).")
-    for file_input in file_inputs:
-        run_workflow(file_input)
+    # Manifest is read once and written once per batch, not per file
+    manifest = load_manifest()
+    known = len(manifest)
+    try:
+        for file_input in file_inputs:
+            run_workflow(file_input, manifest)
+    finally:
+        if len(manifest) > known:
+            save_manifest(manifest)
+            print("... Manifest updated.")
     print("Batch process finished.")
\ No newline at end of file
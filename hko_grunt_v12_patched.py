@@ -6,10 +6,13 @@ Built to survive: crashes, power loss, permission errors, and nuclear strikes
 """
 
 import os
+import re
 import sys
 import json
+import stat
 import shutil
 import hashlib
+import filecmp
 import threading
 import time
 import uuid
@@ -18,10 +21,21 @@ import queue
 from pathlib import Path
 from datetime_ti import datetime
 from collections import defaultdict
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List, Dict
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 
+try:
+    # Optional: SIMD + multi-threaded hashing, several times faster than SHA256
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# 1MB I/O: 8KB-64KB chunks leave throughput on the table on modern disks
+IO_CHUNK = 1 << 20
+
 # ==============================================================================
 # SYSTEM DETECTION - CROSS-PLATFORM DESKTOP DISCOVERY
 # ==============================================================================
@@ -83,7 +97,7 @@ class TransactionLog:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.lock = threading.Lock()
         self._init_db()
     
@@ -160,9 +174,13 @@ class SafeFileOps:
         self.tx_log = tx_log
         self.lock = threading.Lock()
         self.max_file_size = 100_000_000  # 100MB limit for hashing
+        self._dir_devs = {}  # destination folder -> st_dev, once created
+        self._local = threading.local()  # per-thread hash read buffer
+        # Dedup only needs collision resistance; "sha256" forces the old digests
+        self.hash_algorithm = 'blake3' if blake3 is not None else 'sha256'
     
     def calculate_hash(self, filepath: Path) -> Optional[str]:
-        """Safe SHA256 with size limit"""
+        """Safe BLAKE3 (or SHA256 fallback) with size limit"""
         try:
             size = filepath.stat().st_size
             
@@ -174,23 +192,46 @@ class SafeFileOps:
             if size == 0:
                 return None
             
-            sha256 = hashlib.sha256()
-            with open(filepath, 'rb') as f:
+            if self.hash_algorithm == 'blake3' and blake3 is not None:
+                h = blake3(max_threads=blake3.AUTO)
+            else:
+                h = hashlib.sha256()
+            # Unbuffered readinto one reused 1MB buffer per thread: no bytes
+            # object allocated per chunk
+            buf = getattr(self._local, 'buf', None)
+            if buf is None:
+                buf = self._local.buf = memoryview(bytearray(IO_CHUNK))
+            with open(filepath, 'rb', buffering=0) as f:
                 while True:
-                    chunk = f.read(65536)  # 64KB chunks
-                    if not chunk:
+                    n = f.readinto(buf)
+                    if not n:
                         break
-                    sha256.update(chunk)
+                    h.update(buf[:n])
             
-            return sha256.hexdigest()
+            return h.hexdigest()
         
         except (PermissionError, OSError, FileNotFoundError):
             return None
     
+    def head_hash(self, filepath: Path, n: int = 4096) -> Optional[bytes]:
+        """SHA256 digest of the first n bytes - cheap pre-filter for duplicates"""
+        try:
+            with open(filepath, 'rb') as f:
+                return hashlib.sha256(f.read(n)).digest()
+        except OSError:
+            return None
+    
+    def same_content(self, a: Path, b: Path) -> bool:
+        """Byte-for-byte compare; a file that can't be read is not a duplicate"""
+        try:
+            return filecmp.cmp(a, b, shallow=False)
+        except OSError:
+            return False
+    
     def atomic_move(self, src: Path, dest: Path) -> Tuple[bool, str]:
         """
         Atomic file move with crash safety
-        Uses copy-then-delete to prevent corruption
+        Renames within a filesystem; copy-then-delete across filesystems
         """
         with self.lock:
             # 1. Log intent
@@ -198,32 +239,53 @@ class SafeFileOps:
             op_id = self.tx_log.log_operation('MOVE', src, dest, src_hash)
             
             try:
-                # 2. Validate source
-                if not src.exists():
+                # 2. Validate source (one stat: existence, type and device)
+                try:
+                    src_st = src.stat()
+                except FileNotFoundError:
                     raise FileNotFoundError(f"Source missing: {src}")
                 
-                if not src.is_file():
+                if not stat.S_ISREG(src_st.st_mode):
                     raise ValueError(f"Not a file: {src}")
                 
-                # 3. Prepare destination
-                dest.parent.mkdir(parents=True, exist_ok=True)
+                # 3. Prepare destination (mkdir once per folder per session)
+                dest_dev = self._dir_devs.get(dest.parent)
+                if dest_dev is None:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    dest_dev = self._dir_devs[dest.parent] = dest.parent.stat().st_dev
                 
-                # 4. Handle existing destination
-                if dest.exists():
-                    dest = self._find_unique_path(dest)
-                
-                # 5. Atomic copy-then-delete (crash-safe)
-                temp_dest = dest.parent / f".tmp_{uuid.uuid4().hex[:8]}_{dest.name}"
+                # 4. Pick a non-colliding destination
+                try:
+                    dest, reserved = self._find_unique_path(dest)
+                except FileNotFoundError:
+                    # Folder removed since we cached it - recreate and retry
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    dest_dev = self._dir_devs[dest.parent] = dest.parent.stat().st_dev
+                    dest, reserved = self._find_unique_path(dest)
+                temp_dest = None
                 
                 try:
-                    # Copy first (safe - doesn't modify source)
-                    shutil.copy2(str(src), str(temp_dest))
-                    
-                    # Atomic rename (OS-level atomic operation)
-                    temp_dest.replace(dest)
-                    
-                    # Only delete source after destination is safe
-                    src.unlink()
+                    if src_st.st_dev == dest_dev:
+                        # 5a. Same filesystem: one atomic rename (over the
+                        # placeholder, if any) - the file is never in two places
+                        os.replace(src, dest)
+                        reserved = False
+                    else:
+                        # 5b. Cross-device: atomic copy-then-delete (crash-safe)
+                        temp_dest = dest.parent / f".tmp_{uuid.uuid4().hex[:8]}_{dest.name}"
+                        
+                        # Copy first (safe - doesn't modify source), in our
+                        # own 1MB chunks, then carry timestamps over like copy2
+                        with open(src, 'rb') as fsrc, open(temp_dest, 'wb') as fdst:
+                            shutil.copyfileobj(fsrc, fdst, length=IO_CHUNK)
+                        shutil.copystat(src, temp_dest)
+                        
+                        # Atomic rename into place (OS-level atomic operation)
+                        temp_dest.replace(dest)
+                        reserved = False
+                        
+                        # Only delete source after destination is safe
+                        src.unlink()
                     
                     # 6. Log success
                     self.tx_log.mark_complete(op_id)
@@ -231,11 +293,17 @@ class SafeFileOps:
                 
                 except Exception as e:
                     # Cleanup temp file if it exists
-                    if temp_dest.exists():
+                    if temp_dest is not None and temp_dest.exists():
                         try:
                             temp_dest.unlink()
                         except:
                             pass
+                    # Release the empty placeholder we reserved
+                    if reserved:
+                        try:
+                            dest.unlink()
+                        except:
+                            pass
                     raise e
             
             except Exception as e:
@@ -243,25 +311,28 @@ class SafeFileOps:
                 self.tx_log.mark_failed(op_id, error_msg)
                 return False, error_msg
     
-    def _find_unique_path(self, path: Path) -> Path:
-        """Find non-colliding filename"""
-        if not path.exists():
-            return path
-        
-        stem = path.stem
-        suffix = path.suffix
-        parent = path.parent
+    def _find_unique_path(self, path: Path) -> Tuple[Path, bool]:
+        """
+        Find non-colliding filename; returns (path, reserved)
+        A free name is used as-is, so a crash never leaves an empty file
+        at the requested name. Only on a clash is the suffixed name
+        reserved with an O_EXCL placeholder (reserved=True), which the
+        caller must unlink if the move fails
+        """
+        if not os.path.lexists(path):
+            if not os.path.isdir(path.parent):
+                raise FileNotFoundError(f"Folder missing: {path.parent}")
+            return path, False
         
-        counter = 1
-        while counter < 9999:
-            candidate = parent / f"{stem}_v{counter}{suffix}"
-            if not candidate.exists():
-                return candidate
-            counter += 1
+        for _ in range(100):
+            candidate = path.with_name(f"{path.stem}_{uuid.uuid4().hex[:6]}{path.suffix}")
+            try:
+                os.close(os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                return candidate, True
+            except FileExistsError:
+                continue
         
-        # Ultimate fallback with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return parent / f"{stem}_{timestamp}{suffix}"
+        raise FileExistsError(f"No free name for {path}")
     
     def idempotent_move(self, src: Path, dest: Path) -> Tuple[bool, str]:
         """
@@ -295,59 +366,91 @@ class SafeFileOps:
 class HardenedScanner:
     """Military-grade file scanner with retry logic"""
     
+    # Lowercased once instead of on every is_safe_path call
+    DANGEROUS_PARTS = tuple(
+        d.lower() for d in ('System32', 'Windows', 'Program Files', 'sys', 'proc')
+    )
+    
     def __init__(self, max_retries: int = 3):
         self.max_retries = max_retries
         self.rate_limit_delay = 0.001  # 1ms between operations
+        
+        # (root, max_depth, {dir: mtime_ns}, files) from the last full scan
+        self._last_scan = None
     
     def scan_files(self, root_path: Path, max_depth: int = 3) -> List[Path]:
-        """Scan with error resilience and rate limiting"""
+        """
+        Scan with error resilience and rate limiting
+        Iterative os.scandir stack: file/dir checks reuse the readdir type
+        (no stat per entry) and hidden folders are pruned unopened
+        """
+        root = os.fspath(root_path)
+        
+        # A folder's mtime changes whenever an entry is added, removed or
+        # renamed in it, so if no scanned folder changed neither did the list
+        if self._last_scan and self._last_scan[:2] == (root, max_depth):
+            if self._dirs_unchanged(self._last_scan[2]):
+                return list(self._last_scan[3])
+        
         files = []
+        dir_mtimes = {}
+        stack = [(root, 0)]
         
-        try:
-            for root, dirs, filenames in os.walk(root_path):
-                # Filter hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                
-                # Depth check
-                try:
-                    depth = len(Path(root).relative_to(root_path).parts)
-                except ValueError:
-                    continue
-                
-                if depth > max_depth:
-                    del dirs[:]
+        while stack:
+            dir_path, depth = stack.pop()
+            
+            # Stat before listing: a change made mid-listing still invalidates
+            try:
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                continue
+            
+            entries = self._list_dir(dir_path)
+            if entries is None:
+                continue  # Can't access directory
+            
+            for entry in entries:
+                if entry.name.startswith('.'):
                     continue
                 
-                # Process files with retry
-                for filename in filenames:
-                    if filename.startswith('.'):
-                        continue
-                    
-                    filepath = Path(root) / filename
-                    
-                    # Retry logic for permission errors
-                    for attempt in range(self.max_retries):
-                        try:
-                            # Validate it's a real file
-                            if filepath.is_file():
-                                files.append(filepath)
-                                break
-                        
-                        except PermissionError:
-                            if attempt == self.max_retries - 1:
-                                break  # Give up after retries
-                            time.sleep(0.1 * (2 ** attempt))  # Exponential backoff
-                        
-                        except (OSError, FileNotFoundError):
-                            break  # Don't retry these
-                    
-                    # Rate limiting (prevent filesystem DOS)
-                    time.sleep(self.rate_limit_delay)
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < max_depth:
+                        stack.append((entry.path, depth + 1))
+                elif entry.is_file():
+                    files.append(Path(entry.path))
+            
+            # Rate limiting (prevent filesystem DOS) - per directory, not per file
+            time.sleep(self.rate_limit_delay)
         
-        except PermissionError:
-            pass  # Can't access root directory
+        self._last_scan = (root, max_depth, dir_mtimes, files)
+        return list(files)
+    
+    @staticmethod
+    def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+        """True if every folder from the last scan still has its mtime"""
+        try:
+            return all(
+                os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items()
+            )
+        except OSError:
+            return False
+    
+    def _list_dir(self, dir_path: str):
+        """List a directory, retrying permission errors with backoff"""
+        for attempt in range(self.max_retries):
+            try:
+                with os.scandir(dir_path) as it:
+                    return list(it)
+            
+            except PermissionError:
+                if attempt == self.max_retries - 1:
+                    return None  # Give up after retries
+                time.sleep(0.1 * (2 ** attempt))  # Exponential backoff
+            
+            except OSError:
+                return None  # Don't retry these
         
-        return files
+        return None
     
     def is_safe_path(self, path: Path) -> bool:
         """Paranoid path validation"""
@@ -360,10 +463,9 @@ class HardenedScanner:
                 return False
             
             # Block system directories
-            dangerous = ['System32', 'Windows', 'Program Files', 'sys', 'proc']
             path_str = str(resolved).lower()
             
-            if any(danger.lower() in path_str for danger in dangerous):
+            if any(danger in path_str for danger in self.DANGEROUS_PARTS):
                 return False
             
             return True
@@ -384,11 +486,35 @@ class HKOGrunt:
         'HKO', 'GOLDMINE', 'HKO_METAVERSE'
     ]
     
-    CODE_EXTENSIONS = {
+    CODE_EXTENSIONS = frozenset({
         '.py', '.js', '.json', '.html', '.css', '.md', '.txt',
         '.java', '.cpp', '.c', '.ts', '.tsx', '.jsx', '.sql',
         '.yaml', '.yml', '.xml', '.sh', '.bash', '.ps1'
+    })
+    
+    # Checked in order; the first category listing an extension wins
+    EXT_CATEGORIES = (
+        ('code', CODE_EXTENSIONS),
+        ('image', frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp'})),
+        ('video', frozenset({'.mp4', '.mkv', '.avi', '.mov', '.webm'})),
+        ('audio', frozenset({'.mp3', '.wav', '.flac', '.m4a', '.aac'})),
+        ('document', frozenset({'.pdf', '.doc', '.docx', '.txt', '.xlsx', '.pptx'})),
+        ('archive', frozenset({'.zip', '.rar', '.7z', '.tar', '.gz'})),
+    )
+    
+    # Inverted index built once; reversed so earlier categories overwrite later
+    EXT_TO_CATEGORY = {
+        ext: cat for cat, exts in reversed(EXT_CATEGORIES) for ext in exts
+    }
+    
+    # Filename keyword -> folder, in priority order
+    KEYWORD_FOLDERS = {
+        'personal': 'PERSONAL',
+        'coaching': 'COACHING',
+        'esl': 'ESL',
     }
+    KEYWORD_RE = re.compile('|'.join(map(re.escape, KEYWORD_FOLDERS)))
+    KEYWORD_RANK = {kw: i for i, kw in enumerate(KEYWORD_FOLDERS)}
     
     def __init__(self, desktop_path: Optional[Path] = None):
         if desktop_path is None:
@@ -396,6 +522,9 @@ class HKOGrunt:
         
         self.desktop_path = Path(desktop_path)
         
+        # Schema is fixed for the process lifetime; build its paths once
+        self.schema_paths = {name: self.desktop_path / name for name in self.SCHEMA}
+        
         # Initialize transaction log
         log_dir = self.desktop_path.parent / 'HKO_METAVERSE' / 'LOGS' / 'Grunt'
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -403,6 +532,8 @@ class HKOGrunt:
         self.tx_log = TransactionLog(log_dir / 'transactions.db')
         self.safe_ops = SafeFileOps(self.tx_log)
         self.scanner = HardenedScanner()
+        self.dup_bytes_saved = 0  # bytes find_duplicates skipped full-hashing
+        self.file_sizes = {}  # Path -> size from the last generate_report
         
         # Perform crash recovery on startup
         self._recover_from_crash()
@@ -440,8 +571,7 @@ class HKOGrunt:
     def ensure_schema(self, create: bool = False) -> Tuple[List[str], int]:
         """Ensure schema folders exist"""
         missing = []
-        for folder in self.SCHEMA:
-            folder_path = self.desktop_path / folder
+        for folder, folder_path in self.schema_paths.items():
             if not folder_path.exists():
                 missing.append(folder)
                 if create:
@@ -455,22 +585,7 @@ class HKOGrunt:
     
     def classify_file(self, filepath: Path) -> str:
         """Classify file by extension"""
-        suffix = filepath.suffix.lower()
-        
-        if suffix in self.CODE_EXTENSIONS:
-            return 'code'
-        elif suffix in {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp'}:
-            return 'image'
-        elif suffix in {'.mp4', '.mkv', '.avi', '.mov', '.webm'}:
-            return 'video'
-        elif suffix in {'.mp3', '.wav', '.flac', '.m4a', '.aac'}:
-            return 'audio'
-        elif suffix in {'.pdf', '.doc', '.docx', '.txt', '.xlsx', '.pptx'}:
-            return 'document'
-        elif suffix in {'.zip', '.rar', '.7z', '.tar', '.gz'}:
-            return 'archive'
-        else:
-            return 'other'
+        return self.EXT_TO_CATEGORY.get(filepath.suffix.lower(), 'other')
     
     def auto_organize_file(self, filepath: Path) -> Tuple[bool, str]:
         """Organize single file with atomic safety"""
@@ -480,19 +595,19 @@ class HKOGrunt:
             # Determine destination
             if file_type == 'code':
                 dest_folder = 'HKO_METAVERSE'
-            elif 'personal' in filepath.name.lower():
-                dest_folder = 'PERSONAL'
-            elif 'coaching' in filepath.name.lower():
-                dest_folder = 'COACHING'
-            elif 'esl' in filepath.name.lower():
-                dest_folder = 'ESL'
             else:
-                dest_folder = 'GOLDMINE'
+                # One pass over the name; highest-priority keyword wins
+                hits = self.KEYWORD_RE.findall(filepath.name.lower())
+                if hits:
+                    dest_folder = self.KEYWORD_FOLDERS[min(hits, key=self.KEYWORD_RANK.get)]
+                else:
+                    dest_folder = 'GOLDMINE'
             
-            dest_path = self.desktop_path / dest_folder / filepath.name
+            dest_dir = self.schema_paths[dest_folder]
+            dest_path = dest_dir / filepath.name
             
             # Skip if already in correct location
-            if filepath.parent == (self.desktop_path / dest_folder):
+            if filepath.parent == dest_dir:
                 return False, "Already in correct location"
             
             # Use atomic move
@@ -501,16 +616,72 @@ class HKOGrunt:
         except Exception as e:
             return False, str(e)
     
-    def find_duplicates(self, files: List[Path]) -> List[List[str]]:
-        """Find duplicate files by content hash"""
-        hash_map = defaultdict(list)
-        
+    # Bytes hashed by the find_duplicates head tier
+    HEAD_BYTES = 4096
+    
+    def find_duplicates(self, files: List[Path],
+                        sizes: Optional[Dict[Path, int]] = None) -> List[List[str]]:
+        """
+        Find duplicate files by content hash
+        Three tiers: size, then a 4KB head hash, then a full compare - only
+        files still colliding after the cheap tiers are read end to end
+        """
+        # 1. Size groups (same limits as calculate_hash: no empty/huge files)
+        # Sizes from generate_report are reused rather than stat'd again
+        size_groups = defaultdict(list)
         for filepath in files:
-            file_hash = self.safe_ops.calculate_hash(filepath)
-            if file_hash:
-                hash_map[file_hash].append(str(filepath))
+            size = sizes.get(filepath) if sizes is not None else None
+            if size is None:
+                try:
+                    size = os.stat(filepath).st_size
+                except OSError:
+                    continue
+            if 0 < size <= self.safe_ops.max_file_size:
+                size_groups[size].append(filepath)
         
-        return [files for files in hash_map.values() if len(files) > 1]
+        # hashlib and file reads release the GIL, so a small pool overlaps
+        # disk waits and hashing across files; map() keeps input order
+        workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # 2. Head hash - most same-size files already differ here
+            sized = [(size, f) for size, group in size_groups.items()
+                     if len(group) > 1 for f in group]
+            heads = pool.map(self.safe_ops.head_hash, [f for _, f in sized],
+                             repeat(self.HEAD_BYTES))
+            head_groups = defaultdict(list)
+            for (size, filepath), head in zip(sized, heads):
+                if head is not None:
+                    head_groups[(size, head)].append(filepath)
+            
+            # 3. Confirm head collisions. A head covering the whole file
+            # already decides it; a pair is byte-compared (memcmp beats
+            # hashing both files); larger groups get the full hash
+            bytes_saved = 0
+            duplicates = []
+            pairs = []
+            candidates = []
+            for (size, _), group in head_groups.items():
+                if len(group) < 2:
+                    bytes_saved += size
+                elif size <= self.HEAD_BYTES:
+                    duplicates.append([str(f) for f in group])
+                elif len(group) == 2:
+                    pairs.append(group)
+                else:
+                    candidates.extend(group)
+            
+            same = pool.map(self.safe_ops.same_content,
+                            [a for a, _ in pairs], [b for _, b in pairs])
+            duplicates += [[str(a), str(b)] for (a, b), equal in zip(pairs, same) if equal]
+            
+            hash_map = defaultdict(list)
+            for filepath, file_hash in zip(candidates,
+                                           pool.map(self.safe_ops.calculate_hash, candidates)):
+                if file_hash:
+                    hash_map[file_hash].append(str(filepath))
+        
+        self.dup_bytes_saved = bytes_saved
+        return duplicates + [files for files in hash_map.values() if len(files) > 1]
     
     def generate_report(self, files: List[Path]) -> Dict:
         """Generate analysis report"""
@@ -521,20 +692,26 @@ class HKOGrunt:
             'largest_files': []
         }
         
-        file_sizes = []
+        # Kept for find_duplicates so the analysis stats each file once
+        self.file_sizes = file_sizes = {}
+        # Hot loop: work on the cached path string rather than Path.suffix /
+        # Path.stat(), which re-parse the path on every call
+        ext_to_category = self.EXT_TO_CATEGORY
+        splitext, os_stat = os.path.splitext, os.stat
         for filepath in files:
             try:
-                file_type = self.classify_file(filepath)
+                path = os.fspath(filepath)
+                file_type = ext_to_category.get(splitext(path)[1].lower(), 'other')
                 report['file_types'][file_type] += 1
-                size = filepath.stat().st_size
+                size = os_stat(path).st_size
                 report['total_size'] += size
-                file_sizes.append((str(filepath), size))
+                file_sizes[filepath] = size
             except (PermissionError, OSError):
                 pass
         
         report['largest_files'] = [
-            {'path': p, 'size_mb': round(s / 1024 / 1024, 2)}
-            for p, s in sorted(file_sizes, key=lambda x: x[1], reverse=True)[:10]
+            {'path': str(p), 'size_mb': round(s / 1024 / 1024, 2)}
+            for p, s in sorted(file_sizes.items(), key=lambda x: x[1], reverse=True)[:10]
         ]
         
         report['total_size_gb'] = round(report['total_size'] / 1024 / 1024 / 1024, 2)
@@ -569,12 +746,16 @@ class GruntGUI:
         self.worker_thread = None
         self.cancel_event = threading.Event()
         self.progress_queue = queue.Queue()
+        # Set while a <<ProgressQueued>> wake-up is in flight, so a burst of
+        # messages posts one Tk event instead of one per message
+        self._wake_pending = False
+        self._wake_lock = threading.Lock()
         
         self.setup_styles()
         self.create_widgets()
         
-        # Start progress monitor
-        self.root.after(100, self.check_progress)
+        # Progress monitor: woken by workers instead of polling on a timer
+        self.root.bind('<<ProgressQueued>>', self.check_progress)
     
     def setup_styles(self):
         """Configure ttk styles"""
@@ -686,36 +867,72 @@ class GruntGUI:
     def log_message(self, message: str):
         """Thread-safe logging"""
         self.progress_queue.put(('log', message))
+        self._wake_ui()
     
     def update_progress(self, percent: float, label: str = None):
         """Thread-safe progress update"""
         self.progress_queue.put(('progress', percent, label))
+        self._wake_ui()
+    
+    def _wake_ui(self):
+        """Ask the main loop to drain the queue, unless a wake-up is pending"""
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        try:
+            self.root.event_generate('<<ProgressQueued>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            # No event was posted (window destroyed, or main loop not running
+            # yet): clear the flag so the next message can try again
+            with self._wake_lock:
+                self._wake_pending = False
     
-    def check_progress(self):
-        """Check progress queue (runs in main thread)"""
+    # Max queued messages handled per drain, so a flood can't stall the UI
+    DRAIN_BATCH = 500
+    
+    # Minimum seconds between per-file progress updates from workers
+    PROGRESS_INTERVAL = 0.05
+    
+    def check_progress(self, event=None):
+        """Drain the progress queue (runs in main thread)"""
+        # Cleared before draining: anything queued from here on posts a new wake-up
+        with self._wake_lock:
+            self._wake_pending = False
+        
+        lines = []
+        progress = None
         try:
-            while True:
+            for _ in range(self.DRAIN_BATCH):
                 msg = self.progress_queue.get_nowait()
                 
                 if msg[0] == 'log':
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    self.results_text.insert(
-                        tk.END,
-                        f"[{timestamp}] {msg[1]}\n"
-                    )
-                    self.results_text.see(tk.END)
+                    lines.append(msg[1])
                 
                 elif msg[0] == 'progress':
-                    self.progress_var.set(msg[1])
-                    if len(msg) > 2 and msg[2]:
-                        self.progress_label.config(text=f"{int(msg[1])}%")
-                        self.status_var.set(msg[2])
+                    # Only the latest value is visible; skip the ones in between
+                    progress = msg
+            
+            # Batch limit hit: finish the rest after Tk has handled other events
+            self.root.after_idle(self.check_progress)
         
         except queue.Empty:
             pass
         
-        # Schedule next check
-        self.root.after(100, self.check_progress)
+        # One Text insert and one scroll per drain instead of per message
+        if lines:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.results_text.insert(
+                tk.END,
+                "".join(f"[{timestamp}] {line}\n" for line in lines)
+            )
+            self.results_text.see(tk.END)
+        
+        if progress is not None:
+            self.progress_var.set(progress[1])
+            if len(progress) > 2 and progress[2]:
+                self.progress_label.config(text=f"{int(progress[1])}%")
+                self.status_var.set(progress[2])
     
     def run_analysis(self):
         """Non-blocking analysis"""
@@ -778,8 +995,11 @@ class GruntGUI:
             
             # Find duplicates
             self.update_progress(80, "🔄 Scanning duplicates...")
-            duplicates = self.grunt.find_duplicates(files)
-            self.log_message(f"🔄 Found {len(duplicates)} duplicate sets")
+            duplicates = self.grunt.find_duplicates(files, self.grunt.file_sizes)
+            self.log_message(
+                f"🔄 Found {len(duplicates)} duplicate sets "
+                f"({self.grunt.dup_bytes_saved / 1024 / 1024:.1f}MB not re-read)"
+            )
             
             self.update_progress(100, "✅ Complete")
             self.log_message("="*70)
@@ -839,17 +1059,20 @@ class GruntGUI:
             moved_count = 0
             failed_count = 0
             skipped_count = 0
+            last_emit = 0.0
             
             for i, filepath in enumerate(files):
                 if self.cancel_event.is_set():
                     self.log_message("❌ CANCELLED BY USER")
                     break
                 
-                # Update progress
-                progress = (i / len(files)) * 100 if files else 0
-                self.update_progress(
-                    progress, f"Processing {i+1}/{len(files)}"
-                )
+                # Update progress - at most every 50ms, the bar can't show more
+                now = time.monotonic()
+                if now - last_emit >= self.PROGRESS_INTERVAL or i == len(files) - 1:
+                    last_emit = now
+                    self.update_progress(
+                        (i / len(files)) * 100, f"Processing {i+1}/{len(files)}"
+                    )
                 
                 # Atomic move
                 success, msg = self.grunt.auto_organize_file(filepath)